@@ -3,17 +3,42 @@
 import argparse
 import sys
 import os
+import time
 from typing import Optional
 
 from .config import Config
-from .validator import validate_url, is_supported_platform
+from .validator import validate_url
 from .detector import detect_platform, Platform
-from .downloader import DownloadManager
 from .exceptions import ValidationError
 from .logger import setup_logging
 
-# Fix Windows console encoding
-if sys.platform == 'win32':
+
+def _is_utf_stream(stream) -> bool:
+    """Check whether a text stream can encode non-ASCII glyphs."""
+    encoding = (getattr(stream, 'encoding', '') or '').lower().replace('-', '').replace('_', '')
+    return encoding in {'utf8', 'utf16', 'utf32'}
+
+
+def _select_glyphs() -> None:
+    """Choose output glyphs based on what the console can encode."""
+    global _BAR, _OK_MARK, _ERROR_MARK
+    utf_ok = _is_utf_stream(sys.stdout)
+    _BAR = ('█', '░') if utf_ok else ('#', '-')
+    _OK_MARK = '✓ Downloaded:' if utf_ok else '[OK] Downloaded:'
+    _ERROR_MARK = '✗ Error:' if _is_utf_stream(sys.stderr) else '[ERROR]'
+
+
+_select_glyphs()
+
+
+def _fix_windows_console() -> None:
+    """Switch the Windows console streams to UTF-8 if they aren't already."""
+    if sys.platform != 'win32':
+        return
+    
+    if _is_utf_stream(sys.stdout) and _is_utf_stream(sys.stderr):
+        return
+    
     try:
         # Try to set UTF-8 encoding for Windows console
         sys.stdout.reconfigure(encoding='utf-8')
@@ -23,6 +48,8 @@ if sys.platform == 'win32':
         import codecs
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+    
+    _select_glyphs()
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -74,49 +101,72 @@ Examples:
     return parser.parse_args()
 
 
+# Minimum seconds between progress line redraws
+PROGRESS_INTERVAL = 0.1
+
+_INV_MIB = 1.0 / (1024 * 1024)
+
+_last_progress_emit = 0.0
+_last_speed_str = "N/A"
+
+
 def display_progress(progress_data: dict) -> None:
     """Display download progress to user.
     
+    'downloading' updates are limited to one redraw per PROGRESS_INTERVAL;
+    the 'finished' update is always drawn so the bar ends at 100%.
+    
     Args:
         progress_data: Progress information from yt-dlp.
     """
-    if progress_data.get('status') == 'downloading':
+    global _last_progress_emit, _last_speed_str
+    
+    status = progress_data.get('status')
+    now = time.monotonic()
+    
+    if status == 'finished':
+        percentage = 100.0
+    elif status == 'downloading':
+        if now - _last_progress_emit < PROGRESS_INTERVAL:
+            return
+        
         downloaded = progress_data.get('downloaded_bytes', 0)
         total = progress_data.get('total_bytes') or progress_data.get('total_bytes_estimate', 0)
+        if not total > 0:
+            return
+        percentage = min((downloaded / total) * 100, 100.0)
+    else:
+        return
+    
+    if status == 'finished':
+        # yt-dlp's 'finished' update has no speed or ETA; keep the last reading
+        speed_str = _last_speed_str
+        eta_str = "00:00"
+    else:
         speed = progress_data.get('speed', 0)
         eta = progress_data.get('eta', 0)
         
-        if total > 0:
-            percentage = (downloaded / total) * 100
-            
-            # Format speed
-            speed_str = f"{speed / 1024 / 1024:.1f} MB/s" if speed else "N/A"
-            
-            # Format ETA
-            if eta:
-                mins, secs = divmod(eta, 60)
-                eta_str = f"{int(mins):02d}:{int(secs):02d}"
-            else:
-                eta_str = "N/A"
-            
-            # Create progress bar with safe characters
-            bar_length = 30
-            filled = int(bar_length * percentage / 100)
-            
-            # Use ASCII characters for Windows compatibility
-            try:
-                bar = '█' * filled + '░' * (bar_length - filled)
-            except UnicodeEncodeError:
-                # Fallback to ASCII characters
-                bar = '#' * filled + '-' * (bar_length - filled)
-            
-            # Print progress (use \r to overwrite line)
-            try:
-                print(f"\r[{bar}] {percentage:.1f}% | {speed_str} | ETA: {eta_str}", end='', flush=True)
-            except UnicodeEncodeError:
-                # Fallback without special characters
-                bar = '#' * filled + '-' * (bar_length - filled)
-                print(f"\r[{bar}] {percentage:.1f}% | {speed_str} | ETA: {eta_str}", end='', flush=True)
+        # Format speed
+        speed_str = f"{speed * _INV_MIB:.1f} MB/s" if speed else "N/A"
+        
+        # Format ETA
+        if eta:
+            eta = int(eta)
+            eta_str = f"{eta // 60:02d}:{eta % 60:02d}"
+        else:
+            eta_str = "N/A"
+    
+    # Create progress bar
+    bar_length = 30
+    filled = int(bar_length * percentage / 100)
+    bar = _BAR[0] * filled + _BAR[1] * (bar_length - filled)
+    
+    # Print progress (use \r to overwrite line)
+    sys.stdout.write(f"\r[{bar}] {percentage:.1f}% | {speed_str} | ETA: {eta_str}")
+    sys.stdout.flush()
+    
+    _last_progress_emit = now
+    _last_speed_str = speed_str
 
 
 def display_success(file_path: str, video_title: str) -> None:
@@ -126,10 +176,7 @@ def display_success(file_path: str, video_title: str) -> None:
         file_path: Path to downloaded file.
         video_title: Title of the video.
     """
-    try:
-        print(f"\n✓ Downloaded: {video_title}")
-    except UnicodeEncodeError:
-        print(f"\n[OK] Downloaded: {video_title}")
+    print(f"\n{_OK_MARK} {video_title}")
     print(f"  Location: {file_path}")
 
 
@@ -140,14 +187,13 @@ def display_error(error_message: str, error_type: str = "error") -> None:
         error_message: Error message to display.
         error_type: Type of error (for categorization).
     """
-    try:
-        print(f"\n✗ Error: {error_message}", file=sys.stderr)
-    except UnicodeEncodeError:
-        print(f"\n[ERROR] {error_message}", file=sys.stderr)
+    print(f"\n{_ERROR_MARK} {error_message}", file=sys.stderr)
 
 
 def main():
     """Entry point for the CLI application."""
+    _fix_windows_console()
+    
     # Setup logging
     logger = setup_logging()
     
@@ -155,7 +201,7 @@ def main():
         # Parse arguments
         args = parse_arguments()
         url = args.url.strip()
-        logger.info(f"Starting download for URL: {url}")
+        logger.info("Starting download for URL: %s", url)
         
         # Load configuration
         config = Config()
@@ -164,23 +210,20 @@ def main():
         # Validate URL
         is_valid, error_msg = validate_url(url)
         if not is_valid:
-            logger.error(f"URL validation failed: {error_msg}")
+            logger.error("URL validation failed: %s", error_msg)
             display_error(error_msg)
             sys.exit(1)
         
-        # Check if platform is supported
-        if not is_supported_platform(url):
-            platform = detect_platform(url)
-            error_msg = f"Unsupported platform: {platform.value}"
-            logger.error(error_msg)
+        # Detect platform and check that it is supported
+        platform = detect_platform(url)
+        if platform is Platform.UNKNOWN:
+            logger.error("Unsupported platform: %s", platform.value)
             display_error(
                 f"Unsupported platform: {platform.value}. "
                 f"Supported platforms: YouTube, Instagram, Facebook, Telegram"
             )
             sys.exit(1)
         
-        # Detect platform
-        platform = detect_platform(url)
         print(f"Detected platform: {platform.value.capitalize()}")
         print(f"Download directory: {download_dir}")
         
@@ -189,19 +232,24 @@ def main():
         
         print(f"\nStarting download...")
         
-        # Initialize download manager
-        manager = DownloadManager(download_dir)
-        
-        # Download video or audio
-        result = manager.download_video(url, progress_callback=display_progress, audio_only=args.audio_only)
+        # Initialize download manager (imported here so yt-dlp only loads once input is valid)
+        from .downloader import DownloadManager
+        with DownloadManager(download_dir) as manager:
+            # Download video or audio
+            result = manager.download_video(
+                url,
+                progress_callback=display_progress,
+                audio_only=args.audio_only,
+                platform=platform
+            )
         
         # Display result
         if result.success:
-            logger.info(f"Download successful: {result.video_title} -> {result.file_path}")
+            logger.info("Download successful: %s -> %s", result.video_title, result.file_path)
             display_success(result.file_path, result.video_title)
             sys.exit(0)
         else:
-            logger.error(f"Download failed: {result.error_message}")
+            logger.error("Download failed: %s", result.error_message)
             display_error(result.error_message)
             sys.exit(1)
     
@@ -210,7 +258,7 @@ def main():
         print("\n\nDownload cancelled by user.")
         sys.exit(1)
     except Exception as e:
-        logger.exception(f"Unexpected error: {str(e)}")
+        logger.exception("Unexpected error: %s", e)
         display_error(f"Unexpected error: {str(e)}")
         sys.exit(1)
 
@@ -2,10 +2,33 @@
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=8)
+def _cached_load(path_str: str, mtime_ns: int, size: int, inode: int) -> dict:
+    """Parse a config file, memoized per path and file identity.
+    
+    Args:
+        path_str: Path to config file.
+        mtime_ns: Modification time of the file, used as part of the cache key.
+        size: File size, so rewrites within one timestamp tick still miss the cache.
+        inode: File inode, which changes whenever save() replaces the file.
+    
+    Returns:
+        Parsed configuration.
+    
+    Raises:
+        json.JSONDecodeError: If the file is corrupted.
+        IOError: If the file can't be read. Errors are not cached, so a later
+            call retries the read.
+    """
+    with open(path_str, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class Config:
     """Manage user preferences and application settings."""
     
@@ -23,15 +46,20 @@ class Config:
     
     def _load_config(self) -> dict:
         """Load configuration from file or create default."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                # If config is corrupted, return default
-                return self._get_default_config()
-        else:
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            # Missing or unreachable config file (ENOENT, ENOTDIR, ELOOP, ...)
+            return self._get_default_config()
+        
+        try:
+            config_data = _cached_load(str(self.config_path), st.st_mtime_ns, st.st_size, st.st_ino)
+        except (json.JSONDecodeError, IOError):
+            # If config is corrupted or unreadable, return default
             return self._get_default_config()
+        
+        # Copy so that set_download_directory doesn't mutate the cached entry
+        return dict(config_data)
     
     def _get_default_config(self) -> dict:
         """Get default configuration."""
@@ -61,5 +89,14 @@ class Config:
         # Ensure config directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(self.config_data, f, indent=2)
+        # Serialize up front and write once to a temp file, then swap it in atomically
+        data = json.dumps(self.config_data, indent=2)
+        tmp_path = self.config_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', buffering=8192, encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            # Don't leave a partial temp file next to the config
+            tmp_path.unlink(missing_ok=True)
+            raise
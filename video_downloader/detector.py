@@ -13,6 +13,16 @@ class Platform(Enum):
     UNKNOWN = "unknown"
 
 
+# Combined platform pattern; each named group matches a Platform member name
+_PLATFORM_RE = re.compile(
+    r'(?P<youtube>youtube\.com|youtu\.be)'
+    r'|(?P<instagram>instagram\.com)'
+    r'|(?P<facebook>facebook\.com)'
+    r'|(?P<telegram>t\.me|telegram\.org)',
+    re.IGNORECASE
+)
+
+
 def detect_platform(url: str) -> Platform:
     """Detect the platform from URL.
     
@@ -22,22 +32,5 @@ def detect_platform(url: str) -> Platform:
     Returns:
         Platform enum value.
     """
-    url_lower = url.lower()
-    
-    # YouTube patterns
-    if re.search(r'(youtube\.com|youtu\.be)', url_lower):
-        return Platform.YOUTUBE
-    
-    # Instagram patterns
-    if re.search(r'instagram\.com', url_lower):
-        return Platform.INSTAGRAM
-    
-    # Facebook patterns
-    if re.search(r'facebook\.com', url_lower):
-        return Platform.FACEBOOK
-    
-    # Telegram patterns
-    if re.search(r'(t\.me|telegram\.org)', url_lower):
-        return Platform.TELEGRAM
-    
-    return Platform.UNKNOWN
+    match = _PLATFORM_RE.search(url)
+    return Platform[match.lastgroup.upper()] if match else Platform.UNKNOWN
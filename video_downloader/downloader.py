@@ -1,18 +1,39 @@
 """Download manager for video downloader."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Callable
-import yt_dlp
-from pathlib import Path
+import os
+import re
 import shutil
 
 from .detector import Platform, detect_platform
 from .file_manager import sanitize_filename, resolve_filename_conflict, ensure_download_directory
 
 
+# Known yt-dlp error keywords, one named group per user-facing message
+_ERROR_RE = re.compile(
+    r'(?P<unavailable>private|unavailable)'
+    r'|(?P<not_found>not found|404)'
+    r'|(?P<network>network|connection)'
+    r'|(?P<cancelled>cancelled)',
+    re.IGNORECASE
+)
+
+_ERROR_MESSAGES = {
+    'unavailable': "Video is private, restricted, or unavailable",
+    'not_found': "Video not found or has been deleted",
+    'network': "Network error: Please check your internet connection",
+    'cancelled': "Download cancelled by user",
+}
+
+
+@lru_cache(maxsize=1)
 def check_ffmpeg() -> tuple[bool, str]:
     """Check if FFmpeg is installed.
     
+    The PATH lookup runs once per process; later calls return the cached result.
+    
     Returns:
         Tuple of (is_installed, path_or_message)
     """
@@ -47,7 +68,12 @@ class VideoInfo:
 
 
 class DownloadManager:
-    """Manage video download operations using yt-dlp."""
+    """Manage video download operations using yt-dlp.
+    
+    yt-dlp instances are reused across calls and released by close(), so use
+    the manager as a context manager. A manager is not thread-safe; use one
+    per thread.
+    """
     
     def __init__(self, download_dir: str):
         """Initialize download manager with target directory.
@@ -56,7 +82,10 @@ class DownloadManager:
             download_dir: Directory where videos will be saved.
         """
         self.download_dir = download_dir
+        self._output_template = os.path.join(download_dir, '%(title)s.%(ext)s')
         self._cancel_requested = False
+        self._progress_callback: Optional[Callable] = None
+        self._ydl_cache: dict = {}
         ensure_download_directory(download_dir)
         
         # Check for FFmpeg
@@ -77,62 +106,107 @@ class DownloadManager:
         Raises:
             Exception: If unable to fetch video info.
         """
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-        }
+        ydl = self._get_ydl('info')
+        info = ydl.extract_info(url, download=False)
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            
-            # Get available formats/qualities
-            qualities = []
-            if 'formats' in info:
-                for fmt in info['formats']:
-                    if fmt.get('height'):
-                        qualities.append(f"{fmt['height']}p")
-            
-            return VideoInfo(
-                title=info.get('title', 'Unknown'),
-                duration=info.get('duration', 0.0),
-                thumbnail_url=info.get('thumbnail', ''),
-                available_qualities=list(set(qualities)),
-                platform=detect_platform(url),
-                uploader=info.get('uploader', 'Unknown')
-            )
+        # Get available formats/qualities
+        qualities = {f"{fmt['height']}p" for fmt in info.get('formats', ()) if fmt.get('height')}
+        
+        return VideoInfo(
+            title=info.get('title', 'Unknown'),
+            duration=info.get('duration', 0.0),
+            thumbnail_url=info.get('thumbnail', ''),
+            available_qualities=list(qualities),
+            platform=detect_platform(url),
+            uploader=info.get('uploader', 'Unknown')
+        )
     
-    def download_video(self, url: str, progress_callback: Optional[Callable] = None, audio_only: bool = False) -> DownloadResult:
+    def download_video(self, url: str, progress_callback: Optional[Callable] = None, audio_only: bool = False,
+                       platform: Optional[Platform] = None) -> DownloadResult:
         """Download video from URL.
         
         Args:
             url: Video URL to download.
-            progress_callback: Optional callback function for progress updates.
+            progress_callback: Optional callback for 'downloading' and 'finished' progress updates.
             audio_only: If True, download only audio and convert to MP3.
+            platform: Already-detected platform. Detected from the URL if not provided.
         
         Returns:
             DownloadResult with status and file information.
         """
-        platform = detect_platform(url)
+        if platform is None:
+            platform = detect_platform(url)
         self._cancel_requested = False
+        self._progress_callback = progress_callback
+        
+        try:
+            ydl = self._get_ydl('audio' if audio_only else 'video')
+            info = ydl.extract_info(url, download=True)
+            
+            # Get the actual downloaded file path
+            filename = ydl.prepare_filename(info)
+            
+            # Handle filename conflicts
+            final_path = resolve_filename_conflict(filename)
+            if final_path != filename and os.path.exists(filename):
+                os.rename(filename, final_path)
+            
+            return DownloadResult(
+                success=True,
+                file_path=final_path,
+                error_message=None,
+                video_title=info.get('title', 'Unknown'),
+                file_size=info.get('filesize', 0) or info.get('filesize_approx', 0),
+                duration=info.get('duration', 0.0),
+                platform=platform
+            )
         
-        def progress_hook(d):
-            """Hook for yt-dlp progress updates."""
-            if self._cancel_requested:
-                raise Exception("Download cancelled by user")
+        except Exception as e:
+            error_msg = str(e)
+            
+            # Provide user-friendly error messages
+            match = _ERROR_RE.search(error_msg)
+            if match:
+                error_msg = _ERROR_MESSAGES[match.lastgroup]
             
-            if progress_callback and d['status'] == 'downloading':
-                progress_callback(d)
+            return DownloadResult(
+                success=False,
+                file_path=None,
+                error_message=error_msg,
+                video_title='',
+                platform=platform
+            )
+    
+    def _progress_hook(self, d: dict) -> None:
+        """Hook for yt-dlp progress updates."""
+        if self._cancel_requested:
+            raise Exception("Download cancelled by user")
+        
+        if self._progress_callback and d['status'] in ('downloading', 'finished'):
+            self._progress_callback(d)
+    
+    def _ydl_options(self, mode: str) -> dict:
+        """Build yt-dlp options for a download mode.
         
-        # Sanitize output template
-        output_template = str(Path(self.download_dir) / '%(title)s.%(ext)s')
+        Args:
+            mode: 'info' for metadata only, 'audio' for audio-only or 'video'.
         
-        if audio_only:
+        Returns:
+            Options dictionary for yt_dlp.YoutubeDL.
+        """
+        if mode == 'info':
+            return {
+                'quiet': True,
+                'no_warnings': True,
+                'extract_flat': False,
+            }
+        
+        if mode == 'audio':
             # Audio-only configuration
-            ydl_opts = {
+            return {
                 'format': 'bestaudio/best',
-                'outtmpl': output_template,
-                'progress_hooks': [progress_hook],
+                'outtmpl': self._output_template,
+                'progress_hooks': [self._progress_hook],
                 'quiet': False,
                 'no_warnings': False,
                 'extract_flat': False,
@@ -143,69 +217,56 @@ class DownloadManager:
                 }],
                 'prefer_ffmpeg': True,
             }
-        else:
-            # Video with audio configuration
-            ydl_opts = {
-                # Format selection: prefer formats with both video and audio
-                # If separate streams, merge them. Fallback to best single file.
-                'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/bestvideo+bestaudio/best[ext=mp4]/best',
-                'outtmpl': output_template,
-                'progress_hooks': [progress_hook],
-                'quiet': False,
-                'no_warnings': False,
-                'extract_flat': False,
-                'merge_output_format': 'mp4',
-                # Post-processing to ensure audio is merged
-                'postprocessors': [{
-                    'key': 'FFmpegVideoConvertor',
-                    'preferedformat': 'mp4',
-                }],
-                # Prefer formats with audio
-                'prefer_ffmpeg': True,
-            }
         
-        try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=True)
-                
-                # Get the actual downloaded file path
-                filename = ydl.prepare_filename(info)
-                
-                # Handle filename conflicts
-                final_path = resolve_filename_conflict(filename)
-                if final_path != filename and Path(filename).exists():
-                    Path(filename).rename(final_path)
-                
-                return DownloadResult(
-                    success=True,
-                    file_path=final_path,
-                    error_message=None,
-                    video_title=info.get('title', 'Unknown'),
-                    file_size=info.get('filesize', 0) or info.get('filesize_approx', 0),
-                    duration=info.get('duration', 0.0),
-                    platform=platform
-                )
+        # Video with audio configuration
+        return {
+            # Format selection: prefer formats with both video and audio
+            # If separate streams, merge them. Fallback to best single file.
+            'format': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/bestvideo+bestaudio/best[ext=mp4]/best',
+            'outtmpl': self._output_template,
+            'progress_hooks': [self._progress_hook],
+            'quiet': False,
+            'no_warnings': False,
+            'extract_flat': False,
+            'merge_output_format': 'mp4',
+            # Post-processing to ensure audio is merged
+            'postprocessors': [{
+                'key': 'FFmpegVideoConvertor',
+                'preferedformat': 'mp4',
+            }],
+            # Prefer formats with audio
+            'prefer_ffmpeg': True,
+        }
+    
+    def _get_ydl(self, mode: str):
+        """Get the YoutubeDL instance for a download mode, creating it on first use.
         
-        except Exception as e:
-            error_msg = str(e)
-            
-            # Provide user-friendly error messages
-            if 'private' in error_msg.lower() or 'unavailable' in error_msg.lower():
-                error_msg = "Video is private, restricted, or unavailable"
-            elif 'not found' in error_msg.lower() or '404' in error_msg:
-                error_msg = "Video not found or has been deleted"
-            elif 'network' in error_msg.lower() or 'connection' in error_msg.lower():
-                error_msg = "Network error: Please check your internet connection"
-            elif 'cancelled' in error_msg.lower():
-                error_msg = "Download cancelled by user"
-            
-            return DownloadResult(
-                success=False,
-                file_path=None,
-                error_message=error_msg,
-                video_title='',
-                platform=platform
-            )
+        Args:
+            mode: 'info', 'audio' or 'video' (see _ydl_options).
+        
+        Returns:
+            Cached yt_dlp.YoutubeDL instance.
+        """
+        ydl = self._ydl_cache.get(mode)
+        if ydl is None:
+            import yt_dlp
+            ydl = yt_dlp.YoutubeDL(self._ydl_options(mode))
+            self._ydl_cache[mode] = ydl
+        return ydl
+    
+    def close(self) -> None:
+        """Release cached yt-dlp instances (saves cookies, closes connections)."""
+        for ydl in self._ydl_cache.values():
+            ydl.close()
+        self._ydl_cache.clear()
+    
+    def __enter__(self) -> 'DownloadManager':
+        """Enter the context; the manager itself is returned."""
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        """Close cached yt-dlp instances on leaving the context."""
+        self.close()
     
     def cancel_download(self) -> None:
         """Cancel ongoing download and clean up partial files."""
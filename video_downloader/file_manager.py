@@ -5,6 +5,13 @@ import re
 from pathlib import Path
 
 
+# Invalid characters for Windows/Unix: < > : " / \ | ? *
+_FORBIDDEN = str.maketrans('', '', '<>:"/\\|?*')
+_FORBIDDEN_SET = frozenset('<>:"/\\|?*')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 def ensure_download_directory(path: str) -> None:
     """Create download directory if it doesn't exist.
     
@@ -23,14 +30,14 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename safe for file system.
     """
-    # Remove invalid characters for Windows/Unix: < > : " / \ | ? *
-    sanitized = re.sub(r'[<>:"/\\|?*]', '', filename)
+    # Fast path: already-clean names only need trimming. isprintable() rules out
+    # every whitespace character other than a plain space.
+    if (len(filename) <= 200 and '  ' not in filename and filename.isprintable()
+            and not _FORBIDDEN_SET.intersection(filename)):
+        return filename.strip() or "video"
     
-    # Replace multiple spaces with single space
-    sanitized = re.sub(r'\s+', ' ', sanitized)
-    
-    # Trim whitespace
-    sanitized = sanitized.strip()
+    # Remove invalid characters, then replace runs of whitespace with a single space
+    sanitized = _WHITESPACE_RE.sub(' ', filename.translate(_FORBIDDEN)).strip()
     
     # Limit filename length (255 is typical max, leave room for extension)
     max_length = 200
@@ -56,18 +63,29 @@ def resolve_filename_conflict(filepath: str) -> str:
     if not os.path.exists(filepath):
         return filepath
     
-    path = Path(filepath)
-    directory = path.parent
-    stem = path.stem
-    extension = path.suffix
+    directory, name = os.path.split(filepath)
+    stem, extension = os.path.splitext(name)
+    
+    # List the directory once instead of probing each candidate with stat()
+    try:
+        with os.scandir(directory or os.curdir) as entries:
+            existing = {os.path.normcase(entry.name) for entry in entries}
+    except PermissionError:
+        existing = None
     
     counter = 1
     while True:
         new_filename = f"{stem} ({counter}){extension}"
-        new_filepath = directory / new_filename
+        new_filepath = os.path.join(directory, new_filename)
+        
+        # The listing rules out known names without a syscall; the final exists()
+        # check catches case-insensitive matches the listing can't see (e.g. macOS)
+        if existing is not None and os.path.normcase(new_filename) in existing:
+            counter += 1
+            continue
         
-        if not new_filepath.exists():
-            return str(new_filepath)
+        if not os.path.exists(new_filepath):
+            return new_filepath
         
         counter += 1
 
@@ -4,8 +4,35 @@ import logging
 from pathlib import Path
 
 
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches writes, flushing on ERROR rather than after every record."""
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=8192,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        # Like StreamHandler.emit(), but without the flush after every record
+        try:
+            msg = self.format(record)
+            with self.lock:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(msg + self.terminator)
+                if record.levelno >= logging.ERROR:
+                    self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 def setup_logging():
-    """Configure logging to write errors and debug info to log file."""
+    """Configure logging to write errors and debug info to log file.
+    
+    Writes to the log file are buffered; they are flushed on ERROR and
+    when logging shuts down at interpreter exit.
+    """
     log_dir = Path.home() / ".video_downloader"
     log_dir.mkdir(parents=True, exist_ok=True)
     
@@ -15,7 +42,7 @@ def setup_logging():
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_file),
+            _BufferedFileHandler(log_file, encoding='utf-8'),
         ]
     )
     
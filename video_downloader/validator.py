@@ -1,7 +1,8 @@
 """URL validation for video downloader."""
 
 from urllib.parse import urlparse
-import re
+
+from .detector import detect_platform, Platform
 
 
 def validate_url(url: str) -> tuple[bool, str]:
@@ -18,20 +19,20 @@ def validate_url(url: str) -> tuple[bool, str]:
     
     url = url.strip()
     
+    # Reject anything that isn't http(s) before parsing
+    if not url.lower().startswith(('http://', 'https://')):
+        scheme, separator, _ = url.partition('://')
+        if not separator or not scheme:
+            return False, "Invalid URL format: missing protocol (http:// or https://)"
+        return False, f"Invalid URL protocol: {scheme.lower()}. Only http and https are supported"
+    
     try:
         result = urlparse(url)
         
-        # Check if URL has scheme and netloc
-        if not result.scheme:
-            return False, "Invalid URL format: missing protocol (http:// or https://)"
-        
+        # Check that URL has a domain
         if not result.netloc:
             return False, "Invalid URL format: missing domain name"
         
-        # Check if scheme is http or https
-        if result.scheme not in ['http', 'https']:
-            return False, f"Invalid URL protocol: {result.scheme}. Only http and https are supported"
-        
         return True, ""
         
     except Exception as e:
@@ -47,17 +48,4 @@ def is_supported_platform(url: str) -> bool:
     Returns:
         True if platform is supported, False otherwise.
     """
-    supported_patterns = [
-        r'(youtube\.com|youtu\.be)',
-        r'instagram\.com',
-        r'facebook\.com',
-        r'(t\.me|telegram\.org)',
-    ]
-    
-    url_lower = url.lower()
-    
-    for pattern in supported_patterns:
-        if re.search(pattern, url_lower):
-            return True
-    
-    return False
+    return detect_platform(url) is not Platform.UNKNOWN